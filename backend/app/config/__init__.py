@@ -1,3 +1,3 @@
-from .settings import settings
+from .settings import settings, get_settings
 
-__all__ = ["settings"]
+__all__ = ["settings", "get_settings"]
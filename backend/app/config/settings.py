@@ -3,6 +3,7 @@ Application Settings and Configuration
 Handles environment variables and app configuration securely
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import List
 import os
@@ -25,7 +26,22 @@ class Settings(BaseSettings):
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
+
+    # Password Hashing Configuration
+    # bcrypt work factor: each +1 doubles hashing time. 10 keeps logins
+    # fast on modest hardware; raise it where the latency budget allows.
+    bcrypt_rounds: int = 10
+
+    # Encryption Configuration
+    # urlsafe-base64 encoded 256-bit key
+    # (generate with: python -c "import os, base64; print(base64.urlsafe_b64encode(os.urandom(32)).decode())")
+    encryption_key: str
     
+    # Request Limits
+    # Largest accepted request body; keys are small, so anything bigger
+    # is rejected before it reaches parsing or crypto work
+    max_request_bytes: int = 4096
+
     # CORS Configuration
     allowed_origins: List[str] = [
         "http://localhost:5173",
@@ -38,5 +54,18 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the validated Settings instance, constructing it at most once
+
+    Building Settings re-reads .env and runs every pydantic validator, so
+    the instance is cached. Use as a FastAPI dependency
+    (Depends(get_settings)) where per-request injection or test overrides
+    are wanted.
+    """
+    return Settings()
+
+
 # Initialize settings
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,94 @@
+"""
+Life-Pilot Backend API
+FastAPI application entry point
+
+Run with:
+    uvicorn app.main:app --loop uvloop --http httptools
+"""
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+import logging
+
+from app.config.settings import settings
+from app.routes import api_keys_router, health_router
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(
+    title="Life-Pilot Backend API",
+    version="1.0.0",
+    description="Secure API key management backend",
+    # orjson serializes straight to bytes in Rust, several times faster
+    # than the stdlib json encoder on list-heavy responses
+    default_response_class=ORJSONResponse,
+)
+
+class MaxBodySizeMiddleware(BaseHTTPMiddleware):
+    """
+    Reject oversized request bodies from the Content-Length header alone
+
+    An O(1) header check before any body is read, so abusive POSTs never
+    reach JSON parsing or the crypto path.
+    """
+
+    async def dispatch(self, request, call_next):
+        content_length = int(request.headers.get("content-length", 0))
+        if content_length > settings.max_request_bytes:
+            return Response(status_code=413)
+        return await call_next(request)
+
+
+app.add_middleware(MaxBodySizeMiddleware)
+
+# Exact origin strings keep CORSMiddleware on its set-membership fast
+# path (wildcards or a regex would force per-request pattern matching),
+# and explicit method/header lists let preflights short-circuit.
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=list(settings.allowed_origins),
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+)
+
+async def unhandled_exception_handler(request, exc):
+    """
+    Catch-all for errors not raised as HTTPException
+
+    Centralizing this keeps route handlers linear and ensures internal
+    exception messages are logged, never returned to clients.
+    """
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return ORJSONResponse(
+        {"detail": "Internal server error"},
+        status_code=500,
+    )
+
+
+app.add_exception_handler(Exception, unhandled_exception_handler)
+
+app.include_router(health_router)
+app.include_router(api_keys_router)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    logger.info(
+        f"Starting Life-Pilot Backend API in {settings.environment} environment"
+    )
+    uvicorn.run(
+        "app.main:app",
+        host=settings.backend_host,
+        port=settings.backend_port,
+        reload=(settings.environment == "development"),
+    )
@@ -2,78 +2,110 @@
 API Routes for managing API keys securely
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from pydantic import BaseModel
-from typing import Optional
-from app.utils.security import encryption_manager, security_manager
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from typing import Annotated, Optional
+from cachetools import TTLCache
+import msgspec
+from app.utils.security import encryption_manager, security_manager, mask_key
 from app.config.settings import settings
 
 router = APIRouter(prefix="/api/keys", tags=["api-keys"])
 
 
-class APIKeyRequest(BaseModel):
+class APIKeyRequest(msgspec.Struct):
     """Request model for storing API keys"""
-    service_name: str  # e.g., "supabase", "google", "stripe"
-    api_key: str
+    service_name: Annotated[str, msgspec.Meta(max_length=512)]  # e.g., "supabase", "google", "stripe"
+    api_key: Annotated[str, msgspec.Meta(max_length=512)]
     description: Optional[str] = None
 
 
-class APIKeyResponse(BaseModel):
+class APIKeyResponse(msgspec.Struct):
     """Response model for API key operations"""
     service_name: str
-    description: Optional[str] = None
     masked_key: str  # Only return masked key for security
     created_at: str
+    description: Optional[str] = None
+
+
+@dataclass(slots=True)
+class StoredKey:
+    """One stored API key; slotted to keep per-entry memory small"""
+    encrypted_key: str
+    masked_key: str
+    description: Optional[str]
+    created_at: str
 
 
-# In-memory storage (In production, use a database)
-# Format: {service_name: {"encrypted_key": str, "description": str}}
+# In-memory storage (In production, use a database or Redis — this store
+# is per-process, so run a single uvicorn worker or writes in one worker
+# will be invisible to the others)
+# Format: {service_name: StoredKey}
 api_keys_store = {}
 
+# Per-service locks so a store/delete and its cache invalidation are atomic
+# with respect to a concurrent retrieve filling the cache
+_store_locks = defaultdict(asyncio.Lock)
+
+# Decrypted keys cached per service so repeated retrievals skip the AEAD
+# work. Bounded and time-limited; writes invalidate entries immediately.
+_decrypted_key_cache = TTLCache(maxsize=1024, ttl=60)
+
 
 @router.post("/store", response_model=dict)
-async def store_api_key(request: APIKeyRequest):
+async def store_api_key(request: Request):
     """
     Store an API key securely
-    
+
     The API key is encrypted before storage and never exposed in responses.
     Only the service name and a masked version of the key are returned.
+    The body is parsed with msgspec, which validates the JSON against
+    APIKeyRequest in a single pass.
     """
     try:
-        # Validate that service name is not empty
-        if not request.service_name or not request.api_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="service_name and api_key are required"
-            )
-        
-        # Encrypt the API key
-        encrypted_key = encryption_manager.encrypt_api_key(request.api_key)
-        
-        # Store in memory (In production, save to database)
-        api_keys_store[request.service_name] = {
-            "encrypted_key": encrypted_key,
-            "description": request.description,
-            "created_at": __import__("datetime").datetime.utcnow().isoformat()
-        }
-        
-        # Return masked key for verification
-        masked_key = request.api_key[:4] + "*" * (len(request.api_key) - 8) + request.api_key[-4:]
-        
-        return {
-            "success": True,
-            "message": f"API key for {request.service_name} stored securely",
-            "service_name": request.service_name,
-            "masked_key": masked_key,
-            "description": request.description
-        }
-    
-    except Exception as e:
+        payload = msgspec.json.decode(await request.body(), type=APIKeyRequest)
+    except msgspec.DecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+    # Validate that service name is not empty
+    if not payload.service_name or not payload.api_key:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to store API key: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="service_name and api_key are required"
+        )
+
+    # Encrypt the API key
+    encrypted_key = encryption_manager.encrypt_api_key(payload.api_key)
+
+    # Masked key is computed once here so listing never has to decrypt
+    masked_key = mask_key(payload.api_key)
+
+    async with _store_locks[payload.service_name]:
+        # Overwriting a key must drop any cached decryption of the old one
+        _decrypted_key_cache.pop(payload.service_name, None)
+
+        # Store in memory (In production, save to database)
+        api_keys_store[payload.service_name] = StoredKey(
+            encrypted_key=encrypted_key,
+            masked_key=masked_key,
+            description=payload.description,
+            created_at=datetime.now(timezone.utc).isoformat(timespec="seconds")
         )
 
+    return {
+        "success": True,
+        "message": f"API key for {payload.service_name} stored securely",
+        "service_name": payload.service_name,
+        "masked_key": masked_key,
+        "description": payload.description
+    }
+
 
 @router.get("/retrieve/{service_name}")
 async def retrieve_api_key(service_name: str):
@@ -83,32 +115,29 @@ async def retrieve_api_key(service_name: str):
     This endpoint decrypts and returns the API key.
     In production, this should be protected with authentication and authorization.
     """
-    try:
+    async with _store_locks[service_name]:
         if service_name not in api_keys_store:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"API key for {service_name} not found"
             )
-        
+
         stored_data = api_keys_store[service_name]
-        decrypted_key = encryption_manager.decrypt_api_key(
-            stored_data["encrypted_key"]
-        )
-        
-        return {
-            "service_name": service_name,
-            "api_key": decrypted_key,
-            "description": stored_data.get("description"),
-            "created_at": stored_data.get("created_at")
-        }
-    
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve API key: {str(e)}"
-        )
+
+        if service_name in _decrypted_key_cache:
+            decrypted_key = _decrypted_key_cache[service_name]
+        else:
+            decrypted_key = encryption_manager.decrypt_api_key(
+                stored_data.encrypted_key
+            )
+            _decrypted_key_cache[service_name] = decrypted_key
+
+    return {
+        "service_name": service_name,
+        "api_key": decrypted_key,
+        "description": stored_data.description,
+        "created_at": stored_data.created_at
+    }
 
 
 @router.get("/list")
@@ -119,17 +148,13 @@ async def list_api_keys():
     Returns only service names, descriptions, and masked keys.
     """
     keys_list = []
-    
+
     for service_name, data in api_keys_store.items():
-        # Get masked version of the key
-        decrypted = encryption_manager.decrypt_api_key(data["encrypted_key"])
-        masked_key = decrypted[:4] + "*" * (len(decrypted) - 8) + decrypted[-4:]
-        
         keys_list.append({
             "service_name": service_name,
-            "description": data.get("description"),
-            "masked_key": masked_key,
-            "created_at": data.get("created_at")
+            "description": data.description,
+            "masked_key": data.masked_key,
+            "created_at": data.created_at
         })
     
     return {
@@ -141,24 +166,17 @@ async def list_api_keys():
 @router.delete("/delete/{service_name}")
 async def delete_api_key(service_name: str):
     """Delete a stored API key"""
-    try:
+    async with _store_locks[service_name]:
         if service_name not in api_keys_store:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"API key for {service_name} not found"
             )
-        
+
         del api_keys_store[service_name]
-        
-        return {
-            "success": True,
-            "message": f"API key for {service_name} deleted successfully"
-        }
-    
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete API key: {str(e)}"
-        )
+        _decrypted_key_cache.pop(service_name, None)
+
+    return {
+        "success": True,
+        "message": f"API key for {service_name} deleted successfully"
+    }
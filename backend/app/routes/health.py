@@ -2,30 +2,38 @@
 Health check and status routes
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+import orjson
 
 router = APIRouter(tags=["health"])
 
+# Both endpoints return constant payloads, so the JSON is serialized once
+# at import and each request just sends the cached bytes — load balancers
+# poll /health at high QPS and should cost effectively zero CPU.
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "message": "Life-Pilot Backend is running"
+})
+
+_ROOT_BYTES = orjson.dumps({
+    "name": "Life-Pilot Backend API",
+    "version": "1.0.0",
+    "description": "Secure API key management and task management backend",
+    "endpoints": {
+        "health": "/health",
+        "api-keys": "/api/keys",
+        "docs": "/docs"
+    }
+})
+
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "message": "Life-Pilot Backend is running"
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "name": "Life-Pilot Backend API",
-        "version": "1.0.0",
-        "description": "Secure API key management and task management backend",
-        "endpoints": {
-            "health": "/health",
-            "api-keys": "/api/keys",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
@@ -1,3 +1,3 @@
-from .security import security_manager, encryption_manager
+from .security import security_manager, encryption_manager, mask_key
 
-__all__ = ["security_manager", "encryption_manager"]
+__all__ = ["security_manager", "encryption_manager", "mask_key"]
@@ -3,28 +3,63 @@ Security utilities for handling JWT tokens and password hashing
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
+import bcrypt
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from app.config.settings import settings
+import asyncio
+import base64
 import os
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT parameters bound once at import time; settings attribute access goes
+# through pydantic descriptors and is too slow for the per-token hot path.
+_JWT_KEY = settings.jwt_secret_key
+_JWT_ALG = settings.jwt_algorithm
+_JWT_ALGS = [settings.jwt_algorithm]
+_JWT_TTL = timedelta(hours=settings.jwt_expiration_hours)
 
 
 class SecurityManager:
     """Manages security operations like JWT and password handling"""
     
     @staticmethod
-    def hash_password(password: str) -> str:
-        """Hash a password using bcrypt"""
-        return pwd_context.hash(password)
-    
+    async def hash_password(password: str) -> str:
+        """
+        Hash a password using bcrypt
+
+        Runs in a worker thread because bcrypt takes hundreds of
+        milliseconds of CPU time and would otherwise stall the event loop.
+        """
+        def _hash() -> str:
+            salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+            return bcrypt.hashpw(password.encode(), salt).decode()
+
+        return await asyncio.to_thread(_hash)
+
+    @staticmethod
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash (off the event loop)"""
+        return await asyncio.to_thread(
+            bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+        )
+
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+    def password_needs_rehash(hashed_password: str) -> bool:
+        """
+        Check whether a stored hash uses an outdated cost factor
+
+        Call after a successful verify_password and re-hash with
+        hash_password if True, so stored hashes migrate lazily whenever
+        settings.bcrypt_rounds changes.
+        """
+        # bcrypt hashes look like $2b$<rounds>$<salt+digest>
+        try:
+            rounds = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return True
+        return rounds != settings.bcrypt_rounds
     
     @staticmethod
     def create_access_token(
@@ -43,20 +78,15 @@ class SecurityManager:
         """
         to_encode = data.copy()
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                hours=settings.jwt_expiration_hours
-            )
-        
+        expire = datetime.utcnow() + (expires_delta or _JWT_TTL)
+
         to_encode.update({"exp": expire})
-        
+
         try:
             encoded_jwt = jwt.encode(
                 to_encode,
-                settings.jwt_secret_key,
-                algorithm=settings.jwt_algorithm
+                _JWT_KEY,
+                algorithm=_JWT_ALG
             )
             return encoded_jwt
         except Exception as e:
@@ -76,36 +106,72 @@ class SecurityManager:
         try:
             payload = jwt.decode(
                 token,
-                settings.jwt_secret_key,
-                algorithms=[settings.jwt_algorithm]
+                _JWT_KEY,
+                algorithms=_JWT_ALGS
             )
             return payload
-        except JWTError:
+        except jwt.PyJWTError:
             return None
 
 
+# AES-256-GCM cipher constructed once at import time.
+# OpenSSL dispatches to AES-NI hardware instructions where available,
+# so each call is a single C-level operation instead of a Python loop.
+_aead = AESGCM(base64.urlsafe_b64decode(settings.encryption_key))
+_NONCE_SIZE = 12
+
+
+@lru_cache(maxsize=32)
+def _masker(n: int):
+    """
+    Build a masking closure specialized for keys of length n
+
+    Provider keys are usually fixed-width, so the star padding for a
+    given length is computed once here and baked into the closure;
+    each call is then two slices and two concats with no length
+    arithmetic or string multiplication.
+    """
+    stars = "*" * (n - 8)
+    return lambda k, _s=stars: k[:4] + _s + k[-4:]
+
+
+def mask_key(api_key: str) -> str:
+    """
+    Mask an API key, keeping only the first and last 4 characters
+
+    Keys of 8 characters or fewer are masked entirely — revealing both
+    ends of a short key would leave nothing hidden.
+    """
+    n = len(api_key)
+    if n <= 8:
+        return "*" * n
+    return _masker(n)(api_key)
+
+
 class EncryptionManager:
     """Manages encryption of sensitive data"""
-    
+
     @staticmethod
     def encrypt_api_key(api_key: str) -> str:
         """
-        Encrypt an API key for storage
-        In production, use a proper encryption library like cryptography.fernet
+        Encrypt an API key for storage using AES-256-GCM
+
+        A fresh 12-byte nonce is generated per call and prepended to the
+        ciphertext so decryption is self-contained.
         """
-        # This is a basic implementation
-        # For production, implement proper encryption
-        import base64
-        return base64.b64encode(api_key.encode()).decode()
-    
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = _aead.encrypt(nonce, api_key.encode(), None)
+        return base64.urlsafe_b64encode(nonce + ciphertext).decode()
+
     @staticmethod
     def decrypt_api_key(encrypted_key: str) -> str:
         """
         Decrypt an API key from storage
         """
-        import base64
         try:
-            return base64.b64decode(encrypted_key.encode()).decode()
+            raw = base64.urlsafe_b64decode(encrypted_key.encode())
+            nonce, ciphertext = raw[:_NONCE_SIZE], raw[_NONCE_SIZE:]
+            return _aead.decrypt(nonce, ciphertext, None).decode()
         except Exception as e:
             raise Exception(f"Failed to decrypt API key: {str(e)}")
 